@@ -1,63 +1,118 @@
+import itertools
 import random
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
+from typing import NamedTuple
 
 START_GOLD = 20
 ROUND_INCOME = 5
 MAX_UNITS = 6
 
-UNIT_CATALOG = [
-    {"name": "Swordsman", "cost": 4, "max_hp": 24, "attack": 7, "defense": 2, "crit": 0.05, "speed": 5},
-    {"name": "Archer", "cost": 5, "max_hp": 18, "attack": 9, "defense": 1, "crit": 0.10, "speed": 7},
-    {"name": "Guardian", "cost": 6, "max_hp": 32, "attack": 6, "defense": 4, "crit": 0.03, "speed": 3},
-    {"name": "Rogue", "cost": 5, "max_hp": 20, "attack": 8, "defense": 1, "crit": 0.15, "speed": 8},
-]
 
-UPGRADES = [
-    {"key": "damage", "label": "+2 Weapon Damage", "cost": 6, "value": 2},
-    {"key": "crit", "label": "+5% Crit Chance", "cost": 5, "value": 0.05},
-    {"key": "speed", "label": "+1 Weapon Speed", "cost": 4, "value": 1},
-]
-
-
-@dataclass
-class Weapon:
-    damage_bonus: int = 0
-    crit_bonus: float = 0.0
-    speed_bonus: int = 0
-
-
-@dataclass
-class Unit:
+class UnitTemplate(NamedTuple):
     name: str
+    cost: int
     max_hp: int
     attack: int
     defense: int
     crit: float
     speed: int
-    is_hero: bool = False
-    weapon: Weapon | None = None
-    hp: int = 0
 
-    def __post_init__(self) -> None:
-        self.hp = self.max_hp
 
-    def is_alive(self) -> bool:
-        return self.hp > 0
+class Upgrade(NamedTuple):
+    key: str
+    label: str
+    cost: int
+    value: int | float
 
-    def effective_attack(self) -> int:
-        if self.is_hero and self.weapon:
-            return self.attack + self.weapon.damage_bonus
-        return self.attack
 
-    def effective_crit(self) -> float:
-        if self.is_hero and self.weapon:
-            return min(0.75, self.crit + self.weapon.crit_bonus)
-        return self.crit
+UNIT_CATALOG = (
+    UnitTemplate("Swordsman", cost=4, max_hp=24, attack=7, defense=2, crit=0.05, speed=5),
+    UnitTemplate("Archer", cost=5, max_hp=18, attack=9, defense=1, crit=0.10, speed=7),
+    UnitTemplate("Guardian", cost=6, max_hp=32, attack=6, defense=4, crit=0.03, speed=3),
+    UnitTemplate("Rogue", cost=5, max_hp=20, attack=8, defense=1, crit=0.15, speed=8),
+)
+
+UPGRADES = (
+    Upgrade("damage", "+2 Weapon Damage", cost=6, value=2),
+    Upgrade("crit", "+5% Crit Chance", cost=5, value=0.05),
+    Upgrade("speed", "+1 Weapon Speed", cost=4, value=1),
+)
+
+
+class Weapon:
+    __slots__ = ("damage_bonus", "crit_bonus", "speed_bonus")
+
+    def __init__(self, damage_bonus: int = 0, crit_bonus: float = 0.0, speed_bonus: int = 0) -> None:
+        self.damage_bonus = damage_bonus
+        self.crit_bonus = crit_bonus
+        self.speed_bonus = speed_bonus
 
-    def effective_speed(self) -> int:
+    def __repr__(self) -> str:
+        return (
+            f"Weapon(damage_bonus={self.damage_bonus}, crit_bonus={self.crit_bonus}, "
+            f"speed_bonus={self.speed_bonus})"
+        )
+
+
+class Unit:
+    __slots__ = (
+        "name",
+        "max_hp",
+        "attack",
+        "defense",
+        "crit",
+        "speed",
+        "is_hero",
+        "weapon",
+        "hp",
+        "eff_atk",
+        "eff_crit",
+        "eff_spd",
+        "team_id",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        max_hp: int,
+        attack: int,
+        defense: int,
+        crit: float,
+        speed: int,
+        is_hero: bool = False,
+        weapon: Weapon | None = None,
+    ) -> None:
+        self.name = name
+        self.max_hp = max_hp
+        self.attack = attack
+        self.defense = defense
+        self.crit = crit
+        self.speed = speed
+        self.is_hero = is_hero
+        self.weapon = weapon
+        self.hp = max_hp
+        # Assigned by the Team the unit joins; -1 means no team yet.
+        self.team_id = -1
+        self.refresh_effective()
+
+    def __repr__(self) -> str:
+        return f"Unit(name={self.name!r}, hp={self.hp}/{self.max_hp})"
+
+    def refresh_effective(self) -> None:
+        # Weapon bonuses only change between rounds, so fold them in once
+        # instead of re-deriving them on every attack.
         if self.is_hero and self.weapon:
-            return self.speed + self.weapon.speed_bonus
-        return self.speed
+            self.eff_atk = self.attack + self.weapon.damage_bonus
+            self.eff_crit = min(0.75, self.crit + self.weapon.crit_bonus)
+            self.eff_spd = self.speed + self.weapon.speed_bonus
+        else:
+            self.eff_atk = self.attack
+            self.eff_crit = self.crit
+            self.eff_spd = self.speed
+
+    def is_alive(self) -> bool:
+        return self.hp > 0
 
     def take_hit(self, raw_damage: int) -> int:
         mitigated = max(1, raw_damage - self.defense)
@@ -65,16 +120,32 @@ class Unit:
         return mitigated
 
 
+_team_ids = itertools.count()
+
+
 @dataclass
 class Team:
     name: str
     units: list[Unit]
+    team_id: int = field(default_factory=lambda: next(_team_ids))
+    alive: list[Unit] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        for unit in self.units:
+            unit.team_id = self.team_id
+        self.alive = [unit for unit in self.units if unit.is_alive()]
+
+    def add_unit(self, unit: Unit) -> None:
+        unit.team_id = self.team_id
+        self.units.append(unit)
+        if unit.is_alive():
+            self.alive.append(unit)
 
     def alive_units(self) -> list[Unit]:
-        return [unit for unit in self.units if unit.is_alive()]
+        return list(self.alive)
 
     def is_defeated(self) -> bool:
-        return all(not unit.is_alive() for unit in self.units)
+        return not self.alive
 
 
 def prompt_choice(prompt: str, valid: set[str]) -> str:
@@ -98,14 +169,14 @@ def create_hero(name: str, weapon: Weapon) -> Unit:
     )
 
 
-def create_unit(template: dict) -> Unit:
+def create_unit(template: UnitTemplate) -> Unit:
     return Unit(
-        name=template["name"],
-        max_hp=template["max_hp"],
-        attack=template["attack"],
-        defense=template["defense"],
-        crit=template["crit"],
-        speed=template["speed"],
+        name=template.name,
+        max_hp=template.max_hp,
+        attack=template.attack,
+        defense=template.defense,
+        crit=template.crit,
+        speed=template.speed,
     )
 
 
@@ -115,9 +186,9 @@ def run_prematch_shop(gold: int, team: Team) -> int:
         print(f"Gold: {gold} | Units: {len(team.units)}/{MAX_UNITS}")
         for idx, unit in enumerate(UNIT_CATALOG, start=1):
             print(
-                f"{idx}) {unit['name']} - Cost {unit['cost']} | "
-                f"HP {unit['max_hp']} ATK {unit['attack']} DEF {unit['defense']} "
-                f"CRIT {int(unit['crit'] * 100)}% SPD {unit['speed']}"
+                f"{idx}) {unit.name} - Cost {unit.cost} | "
+                f"HP {unit.max_hp} ATK {unit.attack} DEF {unit.defense} "
+                f"CRIT {int(unit.crit * 100)}% SPD {unit.speed}"
             )
         print("D) Done")
 
@@ -133,15 +204,16 @@ def run_prematch_shop(gold: int, team: Team) -> int:
             continue
 
         pick = UNIT_CATALOG[int(choice) - 1]
-        if gold < pick["cost"]:
+        if gold < pick.cost:
             print("Not enough gold.")
             continue
 
-        team.units.append(create_unit(pick))
-        gold -= pick["cost"]
+        team.add_unit(create_unit(pick))
+        gold -= pick.cost
 
 
-def run_upgrade_shop(gold: int, weapon: Weapon, owner: str) -> int:
+def run_upgrade_shop(gold: int, hero: Unit, owner: str) -> int:
+    weapon = hero.weapon
     print(f"\n=== Upgrade Shop ({owner}) ===")
     while True:
         print(
@@ -149,7 +221,7 @@ def run_upgrade_shop(gold: int, weapon: Weapon, owner: str) -> int:
             f"CRIT+{int(weapon.crit_bonus * 100)}% SPD+{weapon.speed_bonus}"
         )
         for idx, upgrade in enumerate(UPGRADES, start=1):
-            print(f"{idx}) {upgrade['label']} - Cost {upgrade['cost']}")
+            print(f"{idx}) {upgrade.label} - Cost {upgrade.cost}")
         print("D) Done")
 
         choice = input("Choose upgrade (1-3) or D to finish: ").strip().lower()
@@ -160,98 +232,110 @@ def run_upgrade_shop(gold: int, weapon: Weapon, owner: str) -> int:
             continue
 
         upgrade = UPGRADES[int(choice) - 1]
-        if gold < upgrade["cost"]:
+        if gold < upgrade.cost:
             print("Not enough gold.")
             continue
 
-        gold -= upgrade["cost"]
-        if upgrade["key"] == "damage":
-            weapon.damage_bonus += upgrade["value"]
-        elif upgrade["key"] == "crit":
-            weapon.crit_bonus = min(0.75, weapon.crit_bonus + upgrade["value"])
-        elif upgrade["key"] == "speed":
-            weapon.speed_bonus += upgrade["value"]
+        gold -= upgrade.cost
+        if upgrade.key == "damage":
+            weapon.damage_bonus += upgrade.value
+        elif upgrade.key == "crit":
+            weapon.crit_bonus = min(0.75, weapon.crit_bonus + upgrade.value)
+        elif upgrade.key == "speed":
+            weapon.speed_bonus += upgrade.value
+        hero.refresh_effective()
 
 
 def ai_buy_units(gold: int, team: Team) -> int:
-    choices = UNIT_CATALOG[:]
-    while gold >= min(unit["cost"] for unit in choices) and len(team.units) < MAX_UNITS:
-        pick = random.choice(choices)
-        if pick["cost"] > gold:
-            continue
-        team.units.append(create_unit(pick))
-        gold -= pick["cost"]
+    cheapest = min(unit.cost for unit in UNIT_CATALOG)
+    affordable = [unit for unit in UNIT_CATALOG if unit.cost <= gold]
+    while gold >= cheapest and len(team.units) < MAX_UNITS:
+        pick = random.choice(affordable)
+        team.add_unit(create_unit(pick))
+        gold -= pick.cost
+        affordable = [unit for unit in affordable if unit.cost <= gold]
     return gold
 
 
-def ai_upgrade_weapon(gold: int, weapon: Weapon) -> int:
-    affordable = [u for u in UPGRADES if u["cost"] <= gold]
+def ai_upgrade_weapon(gold: int, hero: Unit) -> int:
+    weapon = hero.weapon
+    affordable = [u for u in UPGRADES if u.cost <= gold]
     if not affordable:
         return gold
     upgrade = random.choice(affordable)
-    gold -= upgrade["cost"]
-    if upgrade["key"] == "damage":
-        weapon.damage_bonus += upgrade["value"]
-    elif upgrade["key"] == "crit":
-        weapon.crit_bonus = min(0.75, weapon.crit_bonus + upgrade["value"])
-    elif upgrade["key"] == "speed":
-        weapon.speed_bonus += upgrade["value"]
+    gold -= upgrade.cost
+    if upgrade.key == "damage":
+        weapon.damage_bonus += upgrade.value
+    elif upgrade.key == "crit":
+        weapon.crit_bonus = min(0.75, weapon.crit_bonus + upgrade.value)
+    elif upgrade.key == "speed":
+        weapon.speed_bonus += upgrade.value
+    hero.refresh_effective()
     return gold
 
 
-def fight_round(player: Team, enemy: Team, round_num: int) -> str:
-    print(f"\n=== Round {round_num} ===")
-    fighters = player.alive_units() + enemy.alive_units()
-    fighters.sort(key=lambda unit: unit.effective_speed(), reverse=True)
+def fight_round(player: Team, enemy: Team, round_num: int, verbose: bool = True) -> str:
+    if player.team_id == enemy.team_id:
+        raise ValueError(f"Teams {player.name!r} and {enemy.name!r} share team_id {player.team_id}")
+    lines = [f"\n=== Round {round_num} ==="]
+    fighters = player.alive + enemy.alive
+    for unit in fighters:
+        if unit.is_hero:
+            unit.refresh_effective()
+    fighters.sort(key=lambda unit: unit.eff_spd, reverse=True)
 
     for attacker in fighters:
         if not attacker.is_alive():
             continue
-        targets = enemy.alive_units() if attacker in player.units else player.alive_units()
+        targets = enemy.alive if attacker.team_id == player.team_id else player.alive
         if not targets:
             break
         target = random.choice(targets)
-        damage = attacker.effective_attack()
-        if random.random() < attacker.effective_crit():
+        damage = attacker.eff_atk
+        if random.random() < attacker.eff_crit:
             damage = int(damage * 1.8)
             crit_text = " CRIT!"
         else:
             crit_text = ""
         dealt = target.take_hit(damage)
-        print(f"{attacker.name} hits {target.name} for {dealt}.{crit_text}")
+        if not target.is_alive():
+            targets.remove(target)
+        if verbose:
+            lines.append(f"{attacker.name} hits {target.name} for {dealt}.{crit_text}")
 
-    player_alive = len(player.alive_units())
-    enemy_alive = len(enemy.alive_units())
+    if verbose:
+        sys.stdout.write("\n".join(lines) + "\n")
 
-    if enemy_alive == 0 and player_alive == 0:
+    if enemy.is_defeated() and player.is_defeated():
         return "draw"
-    if enemy_alive == 0:
+    if enemy.is_defeated():
         return "player"
-    if player_alive == 0:
+    if player.is_defeated():
         return "enemy"
     return "continue"
 
 
 def display_team(team: Team) -> None:
-    print(f"\n{team.name} team:")
+    lines = [f"\n{team.name} team:"]
     for unit in team.units:
         status = "ALIVE" if unit.is_alive() else "DEAD"
-        print(
+        lines.append(
             f"- {unit.name}: HP {unit.hp}/{unit.max_hp} "
             f"ATK {unit.attack} DEF {unit.defense} CRIT {int(unit.crit * 100)}% "
             f"SPD {unit.speed} [{status}]"
         )
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main() -> None:
     random.seed()
     print("1v1 Battle Arena\n")
 
-    player_weapon = Weapon()
-    enemy_weapon = Weapon()
+    player_hero = create_hero("Hero", Weapon())
+    enemy_hero = create_hero("Warlord", Weapon())
 
-    player_team = Team("Player", [create_hero("Hero", player_weapon)])
-    enemy_team = Team("Enemy", [create_hero("Warlord", enemy_weapon)])
+    player_team = Team("Player", [player_hero])
+    enemy_team = Team("Enemy", [enemy_hero])
 
     player_gold = START_GOLD
     enemy_gold = START_GOLD
@@ -277,8 +361,8 @@ def main() -> None:
 
         player_gold += ROUND_INCOME + 2
         enemy_gold += ROUND_INCOME + 2
-        player_gold = run_upgrade_shop(player_gold, player_weapon, "Player")
-        enemy_gold = ai_upgrade_weapon(enemy_gold, enemy_weapon)
+        player_gold = run_upgrade_shop(player_gold, player_hero, "Player")
+        enemy_gold = ai_upgrade_weapon(enemy_gold, enemy_hero)
 
         round_num += 1
 
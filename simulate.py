@@ -0,0 +1,169 @@
+"""Headless helpers for batched AI-vs-AI balance runs.
+
+The interactive game in ``main`` only needs the standard library; this module
+keeps NumPy copies of the unit catalog so simulation code can index units by id.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+from numba import njit
+
+from main import UNIT_CATALOG, Unit
+
+# Match results shared by simulate_round and simulate_match.
+ONGOING = -1
+DRAW = 0
+PLAYER_WIN = 1
+ENEMY_WIN = 2
+
+# Structure-of-arrays copy of UNIT_CATALOG; index i is UNIT_CATALOG[i].
+CATALOG_COST = np.array([t.cost for t in UNIT_CATALOG], dtype=np.int32)
+CATALOG_HP = np.array([t.max_hp for t in UNIT_CATALOG], dtype=np.int32)
+CATALOG_ATK = np.array([t.attack for t in UNIT_CATALOG], dtype=np.int32)
+CATALOG_DEF = np.array([t.defense for t in UNIT_CATALOG], dtype=np.int32)
+CATALOG_CRIT = np.array([t.crit for t in UNIT_CATALOG], dtype=np.float32)
+CATALOG_SPD = np.array([t.speed for t in UNIT_CATALOG], dtype=np.int32)
+
+
+class TeamArrays(NamedTuple):
+    hp: np.ndarray
+    atk: np.ndarray
+    defn: np.ndarray
+    crit: np.ndarray
+    spd: np.ndarray
+
+
+def team_arrays(units: list[Unit]) -> TeamArrays:
+    for unit in units:
+        unit.refresh_effective()
+    return TeamArrays(
+        hp=np.array([u.hp for u in units], dtype=np.int32),
+        atk=np.array([u.eff_atk for u in units], dtype=np.int32),
+        defn=np.array([u.defense for u in units], dtype=np.int32),
+        crit=np.array([u.eff_crit for u in units], dtype=np.float32),
+        spd=np.array([u.eff_spd for u in units], dtype=np.int32),
+    )
+
+
+def catalog_arrays(unit_ids: np.ndarray) -> TeamArrays:
+    """Build a team from UNIT_CATALOG indices without creating Unit objects."""
+    return TeamArrays(
+        hp=CATALOG_HP[unit_ids],
+        atk=CATALOG_ATK[unit_ids],
+        defn=CATALOG_DEF[unit_ids],
+        crit=CATALOG_CRIT[unit_ids],
+        spd=CATALOG_SPD[unit_ids],
+    )
+
+
+def simulate_round(player: TeamArrays, enemy: TeamArrays, rng: np.random.Generator) -> int:
+    """Resolve one round in place on ``player.hp``/``enemy.hp``, silently.
+
+    Returns ONGOING while both sides still stand, otherwise DRAW, PLAYER_WIN
+    or ENEMY_WIN.
+
+    Mirrors ``main.fight_round`` but draws all crit and targeting rolls for the
+    round from ``rng`` up front instead of calling ``random`` per attacker.
+    """
+    alive = [np.flatnonzero(player.hp > 0).tolist(), np.flatnonzero(enemy.hp > 0).tolist()]
+    teams = (player, enemy)
+    n_player = len(alive[0])
+    unit_ids = alive[0] + alive[1]
+    n_attackers = len(unit_ids)
+
+    speeds = np.concatenate((player.spd[alive[0]], enemy.spd[alive[1]]))
+    order = np.argsort(-speeds, kind="stable")
+    rolls = rng.random((n_attackers, 2))
+
+    for slot, fighter in enumerate(order.tolist()):
+        side = 0 if fighter < n_player else 1
+        idx = unit_ids[fighter]
+        attacker = teams[side]
+        if attacker.hp[idx] <= 0:
+            continue
+        targets = alive[1 - side]
+        if not targets:
+            break
+        pos = int(rolls[slot, 0] * len(targets))
+        target = targets[pos]
+        defender = teams[1 - side]
+
+        damage = int(attacker.atk[idx])
+        if rolls[slot, 1] < attacker.crit[idx]:
+            damage = int(damage * 1.8)
+        dealt = max(1, damage - int(defender.defn[target]))
+        defender.hp[target] = max(0, int(defender.hp[target]) - dealt)
+        if defender.hp[target] == 0:
+            targets[pos] = targets[-1]
+            targets.pop()
+
+    if not alive[0] and not alive[1]:
+        return DRAW
+    if not alive[1]:
+        return PLAYER_WIN
+    if not alive[0]:
+        return ENEMY_WIN
+    return ONGOING
+
+
+@njit(cache=True)
+def simulate_match(p_hp, p_atk, p_def, p_spd, p_crit, e_hp, e_atk, e_def, e_spd, e_crit, seed):
+    """Play rounds until one side is wiped out; returns DRAW, PLAYER_WIN or ENEMY_WIN.
+
+    Compiled counterpart of repeated ``simulate_round`` calls. The hp arrays are
+    copied, so the same team columns can be replayed with different seeds.
+    """
+    np.random.seed(seed)
+    n_player = p_hp.shape[0]
+    n_total = n_player + e_hp.shape[0]
+
+    hp = np.empty(n_total, dtype=np.int32)
+    atk = np.empty(n_total, dtype=np.int32)
+    defn = np.empty(n_total, dtype=np.int32)
+    spd = np.empty(n_total, dtype=np.int32)
+    crit = np.empty(n_total, dtype=np.float32)
+    hp[:n_player] = p_hp
+    hp[n_player:] = e_hp
+    atk[:n_player] = p_atk
+    atk[n_player:] = e_atk
+    defn[:n_player] = p_def
+    defn[n_player:] = e_def
+    spd[:n_player] = p_spd
+    spd[n_player:] = e_spd
+    crit[:n_player] = p_crit
+    crit[n_player:] = e_crit
+
+    # Speeds never change mid-match, so the turn order is fixed.
+    order = np.argsort(-spd, kind="mergesort")
+    alive = np.empty((2, n_total), dtype=np.int64)
+    n_alive = np.zeros(2, dtype=np.int64)
+    for unit in range(n_total):
+        if hp[unit] > 0:
+            side = 0 if unit < n_player else 1
+            alive[side, n_alive[side]] = unit
+            n_alive[side] += 1
+
+    while n_alive[0] > 0 and n_alive[1] > 0:
+        for attacker in order:
+            if hp[attacker] <= 0:
+                continue
+            foe = 1 if attacker < n_player else 0
+            if n_alive[foe] == 0:
+                break
+            pos = int(np.random.random() * n_alive[foe])
+            target = alive[foe, pos]
+
+            damage = atk[attacker]
+            if np.random.random() < crit[attacker]:
+                damage = int(damage * 1.8)
+            hp[target] = max(0, hp[target] - max(1, damage - defn[target]))
+            if hp[target] == 0:
+                n_alive[foe] -= 1
+                alive[foe, pos] = alive[foe, n_alive[foe]]
+
+    if n_alive[0] == 0 and n_alive[1] == 0:
+        return DRAW
+    if n_alive[1] == 0:
+        return PLAYER_WIN
+    return ENEMY_WIN
@@ -0,0 +1,71 @@
+import random
+
+import pytest
+
+import main
+
+
+def make_team(name, *catalog_ids, **kwargs):
+    return main.Team(name, [main.create_unit(main.UNIT_CATALOG[i]) for i in catalog_ids], **kwargs)
+
+
+def test_default_teams_get_distinct_ids_stamped_on_units():
+    player = main.Team("P", [main.create_hero("Hero", main.Weapon())])
+    enemy = make_team("E", 0)
+    player.add_unit(main.create_unit(main.UNIT_CATALOG[1]))
+    enemy.add_unit(main.create_unit(main.UNIT_CATALOG[2]))
+
+    assert player.team_id != enemy.team_id
+    assert all(unit.team_id == player.team_id for unit in player.units)
+    assert all(unit.team_id == enemy.team_id for unit in enemy.units)
+
+
+def test_fight_round_hits_the_other_side():
+    player = make_team("P", 2)
+    enemy = make_team("E", 2)
+
+    assert main.fight_round(player, enemy, 1, verbose=False) == "continue"
+
+    # Each Guardian survives one hit, so both must have been struck exactly once.
+    guardian = main.UNIT_CATALOG[2]
+    assert player.units[0].hp < guardian.max_hp
+    assert enemy.units[0].hp < guardian.max_hp
+
+
+def test_fight_round_rejects_shared_team_id():
+    with pytest.raises(ValueError):
+        main.fight_round(make_team("P", 0, team_id=5), make_team("E", 1, team_id=5), 1)
+
+
+def test_alive_tracks_deaths_and_alive_units_is_a_copy():
+    random.seed(3)
+    player = make_team("P", 0, 1, 3)
+    enemy = make_team("E", 1, 1, 0)
+
+    round_num = 1
+    while all(unit.is_alive() for team in (player, enemy) for unit in team.units):
+        main.fight_round(player, enemy, round_num, verbose=False)
+        round_num += 1
+
+    for team in (player, enemy):
+        assert team.alive == [unit for unit in team.units if unit.is_alive()]
+        assert team.is_defeated() == (not team.alive)
+
+        before = list(team.alive)
+        snapshot = team.alive_units()
+        snapshot.clear()
+        assert team.alive == before
+
+
+def test_ai_upgrade_weapon_refreshes_hero_stats():
+    random.seed(0)
+    hero = main.create_hero("Hero", main.Weapon())
+
+    for _ in range(6):
+        main.ai_upgrade_weapon(10, hero)
+
+    weapon = hero.weapon
+    assert (weapon.damage_bonus, weapon.crit_bonus, weapon.speed_bonus) != (0, 0.0, 0)
+    assert hero.eff_atk == hero.attack + weapon.damage_bonus
+    assert hero.eff_crit == min(0.75, hero.crit + weapon.crit_bonus)
+    assert hero.eff_spd == hero.speed + weapon.speed_bonus
@@ -0,0 +1,109 @@
+import random
+
+import numpy as np
+
+import main
+import simulate
+from simulate import DRAW, ENEMY_WIN, ONGOING, PLAYER_WIN
+
+PLAYER_IDS = np.array([0, 1, 3])
+ENEMY_IDS = np.array([2, 2, 0])
+MATCHES = 2000
+
+
+def run_match(player, enemy, seed):
+    return simulate.simulate_match(
+        player.hp, player.atk, player.defn, player.spd, player.crit,
+        enemy.hp, enemy.atk, enemy.defn, enemy.spd, enemy.crit,
+        seed,
+    )
+
+
+def empty_team():
+    return simulate.catalog_arrays(np.array([], dtype=np.int64))
+
+
+def fight_round_rate():
+    random.seed(0)
+    wins = 0
+    for _ in range(MATCHES):
+        player = main.Team("P", [main.create_unit(main.UNIT_CATALOG[i]) for i in PLAYER_IDS])
+        enemy = main.Team("E", [main.create_unit(main.UNIT_CATALOG[i]) for i in ENEMY_IDS])
+        result, round_num = "continue", 1
+        while result == "continue":
+            result = main.fight_round(player, enemy, round_num, verbose=False)
+            round_num += 1
+        wins += result == "player"
+    return wins / MATCHES
+
+
+def test_team_arrays_uses_effective_stats_and_current_hp():
+    hero = main.create_hero("Hero", main.Weapon(damage_bonus=3, crit_bonus=0.9, speed_bonus=2))
+    swordsman = main.create_unit(main.UNIT_CATALOG[0])
+    hero.take_hit(10)
+
+    team = simulate.team_arrays([hero, swordsman])
+
+    assert team.hp.tolist() == [hero.hp, swordsman.max_hp]
+    assert hero.hp < hero.max_hp
+    assert team.atk.tolist() == [hero.attack + 3, swordsman.attack]
+    assert team.spd.tolist() == [hero.speed + 2, swordsman.speed]
+    assert team.defn.tolist() == [hero.defense, swordsman.defense]
+    np.testing.assert_allclose(team.crit, [0.75, swordsman.crit], rtol=1e-6)
+
+
+def test_simulate_match_is_seeded_and_leaves_inputs_untouched():
+    player = simulate.catalog_arrays(PLAYER_IDS)
+    enemy = simulate.catalog_arrays(ENEMY_IDS)
+    before = [a.copy() for a in player + enemy]
+
+    results = [run_match(player, enemy, seed) for seed in range(50)]
+
+    assert results == [run_match(player, enemy, seed) for seed in range(50)]
+    assert set(results) <= {DRAW, PLAYER_WIN, ENEMY_WIN}
+    for original, after in zip(before, player + enemy):
+        np.testing.assert_array_equal(original, after)
+
+
+def test_empty_teams():
+    team = simulate.catalog_arrays(PLAYER_IDS)
+
+    assert run_match(empty_team(), empty_team(), 0) == DRAW
+    assert run_match(team, empty_team(), 0) == PLAYER_WIN
+    assert run_match(empty_team(), team, 0) == ENEMY_WIN
+    assert simulate.simulate_round(empty_team(), empty_team(), np.random.default_rng(0)) == DRAW
+    assert simulate.simulate_round(team, empty_team(), np.random.default_rng(0)) == PLAYER_WIN
+
+
+def test_simulate_round_is_seeded():
+    outcomes = []
+    for _ in range(2):
+        player = simulate.catalog_arrays(PLAYER_IDS)
+        enemy = simulate.catalog_arrays(ENEMY_IDS)
+        rng = np.random.default_rng(7)
+        result = ONGOING
+        while result == ONGOING:
+            result = simulate.simulate_round(player, enemy, rng)
+        outcomes.append((result, player.hp.tolist(), enemy.hp.tolist()))
+
+    assert outcomes[0] == outcomes[1]
+
+
+def test_kernels_match_fight_round_win_rate():
+    rng = np.random.default_rng(0)
+    round_wins = 0
+    for _ in range(MATCHES):
+        player = simulate.catalog_arrays(PLAYER_IDS)
+        enemy = simulate.catalog_arrays(ENEMY_IDS)
+        result = ONGOING
+        while result == ONGOING:
+            result = simulate.simulate_round(player, enemy, rng)
+        round_wins += result == PLAYER_WIN
+
+    player = simulate.catalog_arrays(PLAYER_IDS)
+    enemy = simulate.catalog_arrays(ENEMY_IDS)
+    match_wins = sum(run_match(player, enemy, seed) == PLAYER_WIN for seed in range(MATCHES))
+
+    expected = fight_round_rate()
+    assert abs(round_wins / MATCHES - expected) < 0.05
+    assert abs(match_wins / MATCHES - expected) < 0.05